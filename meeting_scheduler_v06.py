@@ -1,8 +1,24 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import datetime
-import pytz
-from functools import partial
+import os
+import pickle
+from functools import partial, lru_cache
+from itertools import groupby
+
+try:
+    from zoneinfo import ZoneInfo, available_timezones
+    # zoneinfo ships no data of its own; this raises ZoneInfoNotFoundError
+    # (a KeyError) when there is no tz database, e.g. Windows without tzdata
+    ZoneInfo("America/Los_Angeles")
+    TZ_BACKEND = "zoneinfo"
+except (ImportError, KeyError):  # Python < 3.9, or no tz database
+    import pytz
+    ZoneInfo = pytz.timezone
+    TZ_BACKEND = f"pytz-{pytz.VERSION}"
+
+    def available_timezones():
+        return set(pytz.all_timezones)
 
 try:
     import tzlocal
@@ -10,9 +26,92 @@ try:
 except ImportError:
     system_tz = "America/Los_Angeles"  # Default to LA
 
+TZ_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "meeting_scheduler", "tz_list.pkl")
+
+# US major timezones
+US_TIMEZONES = [
+    'America/Los_Angeles',  # Pacific Time
+    'America/Denver',       # Mountain Time
+    'America/Chicago',      # Central Time
+    'America/New_York',     # Eastern Time
+    'America/Anchorage',    # Alaska Time
+    'Pacific/Honolulu',     # Hawaii Time
+]
+
+def tz_data_version():
+    """Best-effort version of the tz database behind ZoneInfo, or None"""
+    if TZ_BACKEND != "zoneinfo":
+        return None  # pytz's data version is already part of TZ_BACKEND
+    import zoneinfo
+    # zoneinfo prefers the system database over the tzdata package
+    for path in zoneinfo.TZPATH:
+        try:
+            with open(os.path.join(path, 'tzdata.zi')) as f:
+                return f.readline().split()[-1]  # "# version 2025b"
+        except (OSError, IndexError):
+            continue
+    try:
+        from importlib.metadata import version
+        return version('tzdata')
+    except Exception:
+        return None
+
+def next_offset_change(zones, start, horizon=datetime.timedelta(days=7)):
+    """Return a UTC instant at or just before the first offset change of any zone.
+
+    Scans day by day from start and bisects down to the minute; returns
+    start + horizon when no zone changes offset within the horizon.
+    """
+    def changed(a, b):
+        return any(a.astimezone(tz).utcoffset() != b.astimezone(tz).utcoffset() for tz in zones)
+
+    end = start + horizon
+    lo = start
+    while lo < end:
+        hi = min(lo + datetime.timedelta(days=1), end)
+        if changed(lo, hi):
+            while hi - lo > datetime.timedelta(minutes=1):
+                mid = lo + (hi - lo) / 2
+                if changed(lo, mid):
+                    hi = mid
+                else:
+                    lo = mid
+            return lo
+        lo = hi
+    return end
+
+def localize(tz, dt):
+    # pytz zones need localize(); zoneinfo zones can be attached directly
+    if hasattr(tz, 'localize'):
+        return tz.localize(dt)
+    return dt.replace(tzinfo=tz)
+
+def get_zone(tz_name):
+    # The "Etc/UTC" fallback must work even if the tz database is missing
+    if tz_name == "Etc/UTC":
+        return datetime.timezone.utc
+    return ZoneInfo(tz_name)
+
+@lru_cache(maxsize=64)
+def slot_tables(slot_dts, local_name, target_name):
+    """Convert naive slot times from local_name to target_name.
+
+    Returns (local_strs, target_strs, business), memoized per timezone
+    pair so switching back to a pair is free.
+    """
+    local_tz = get_zone(local_name)
+    target_tz = get_zone(target_name)
+    local_times = tuple(localize(local_tz, dt) for dt in slot_dts)
+    target_times = tuple(dt.astimezone(target_tz) for dt in local_times)
+    local_strs = tuple(f"{dt.hour:02d}:{dt.minute:02d}" for dt in local_times)
+    target_strs = tuple(f"{dt.hour:02d}:{dt.minute:02d}" for dt in target_times)
+    business = tuple(8 <= dt.hour < 18 for dt in target_times)
+    return local_strs, target_strs, business
+
 class AutocompleteCombobox(ttk.Combobox):
     def set_completion_list(self, completion_list):
         self._completion_list = sorted(completion_list, key=lambda s: s.lower())
+        self._lower_list = [s.lower() for s in self._completion_list]
         self['values'] = self._completion_list
         self.bind('<KeyRelease>', self._handle_keyrelease)
 
@@ -20,7 +119,7 @@ class AutocompleteCombobox(ttk.Combobox):
         if event.keysym in ("BackSpace", "Left", "Right", "Up", "Down", "Return", "Escape", "Tab"):
             return
         value = self.get().lower()
-        filtered = [item for item in self._completion_list if value in item.lower()]
+        filtered = [item for item, lower in zip(self._completion_list, self._lower_list) if value in lower]
         self['values'] = filtered
 
 class MeetingScheduler(tk.Tk):
@@ -29,31 +128,33 @@ class MeetingScheduler(tk.Tk):
         super().__init__()
         self.title("Meeting Scheduler")
         self.configure(bg='black')
-        self.cell_states = {}
         self.dragging = False
         self.start_cell = None
         self.last_cell = None
         self.selection_mode = False
+        self._pending_proposal = None
+        self._load_job = None
+        self._closed = False
 
         # Initialize these dictionaries
         self.local_time_labels = {}
         self.other_time_labels = {}
-        self.slot_labels = {}
 
         # Define the time label width
         self.time_label_width = 9
 
+        # Define the grid row height in pixels
+        self.row_height = 24
+
         # Define the day header width
         self.day_header_width = 14
 
+        # Define how many slot rows to create per idle callback
+        self.grid_chunk_slots = 6
+
         # Set initial window size
         self.geometry("1300x500")
 
-        # Optimization: Precalculate timezones at startup
-        print("Getting timezones...")
-        self.timezone_list = self.get_timezones()
-        self.tz_display_map = {tz: disp for disp, tz in self.timezone_list}
-
         # Make the window resizable
         print("Setting up grid configuration...")
         self.grid_rowconfigure(0, weight=1)
@@ -71,52 +172,136 @@ class MeetingScheduler(tk.Tk):
         style.configure('TButton', background='gray', foreground='white')
         style.configure('TCombobox', fieldbackground='gray', background='gray', foreground='white')
 
-        # Add drag bindings
-        self.bind_all("<B1-Motion>", self.on_drag)
-        self.bind_all("<ButtonRelease-1>", self.on_release)
+        # Let the window paint right away and build the rest in idle phases
+        self.ready = False
+        self.loading_label = tk.Label(self, text="Loading…", bg='black', fg='white')
+        self.loading_label.place(relx=0.5, rely=0.5, anchor='center')
+        self._schedule_phase(self._phase1_timezones)
 
+    def _schedule_phase(self, phase, *args, delay=None):
+        if delay is None:
+            self._load_job = self.after_idle(self._run_phase, phase, *args)
+        else:
+            self._load_job = self.after(delay, self._run_phase, phase, *args)
+
+    def _run_phase(self, phase, *args):
+        self._load_job = None
+        if self._closed:
+            return
+        try:
+            phase(*args)
+        except Exception as e:
+            # Don't leave the user staring at the placeholder
+            print(f"Error during startup: {e}")
+            if self.loading_label.winfo_exists():
+                self.loading_label.config(text=f"Failed to load: {e}")
+                self.loading_label.lift()
+            messagebox.showerror("Meeting Scheduler", f"Failed to load: {e}")
+
+    def destroy(self):
+        # Closing mid-load must not let queued phases run against a dead window
+        self._closed = True
+        for job in (self._load_job, self._pending_proposal):
+            if job:
+                self.after_cancel(job)
+        self._load_job = self._pending_proposal = None
+        super().destroy()
+
+    def _phase1_timezones(self):
+        # Optimization: Precalculate timezones at startup
+        print("Getting timezones...")
+        self.timezone_list = self.get_timezones()
+        self.tz_display_map = {tz: disp for disp, tz in self.timezone_list}
+        self._disp_to_tzname = {disp: tz for disp, tz in self.timezone_list}
+        self._schedule_phase(self._phase2_widgets)
+
+    def _phase2_widgets(self):
         print("Creating sections...")
         self.create_top_section()
         self.create_calendar_section()
         self.create_bottom_section()
+        self.loading_label.lift()
+        self._schedule_phase(self._phase3_grid)
+
+    def _phase3_grid(self, start_slot=0):
+        if start_slot == 0:
+            print("Creating time grid...")
+            self.create_time_grid()
+        end_slot = min(start_slot + self.grid_chunk_slots, self.total_slots)
+        self.create_grid_rows(start_slot, end_slot)
+
+        if end_slot < self.total_slots:
+            self._schedule_phase(self._phase3_grid, end_slot, delay=1)
+        else:
+            self._schedule_phase(self._finish_init)
 
+    def _finish_init(self):
         print("Adding event bindings...")
-        self.bind_all("<B1-Motion>", self.on_drag)
-        self.bind_all("<ButtonRelease-1>", self.on_release)
+        # Tk grabs the pointer for the canvas on press, so drag and release
+        # events keep arriving here even once the pointer leaves it
+        self.canvas.bind("<B1-Motion>", self.on_drag)
+        self.canvas.bind("<ButtonRelease-1>", self.on_release)
+        self.canvas.tag_bind('cell', "<Button-1>", self.on_cell_click)
+        self.canvas.tag_bind('cell', "<Button-3>", self.on_cell_right_click)
+
+        # Grid items follow the header columns, so re-layout whenever they move
+        self.header_frame.bind("<Configure>", self._layout_grid)
+        self._layout_grid()
 
         # Initialize display
         print("Updating time labels...")
+        self._recompute_tz_tables()
         self.update_time_labels()
+        self.ready = True
+        self.loading_label.destroy()
+
         print("Setting initial scroll position...")
         self.after(100, lambda: self.canvas.yview_moveto(12/self.total_slots))
 
-        print("Initialization complete, starting mainloop...")
+        print("Initialization complete")
 
     def get_timezones(self):
-        """Get US and all Africa timezones"""
-        
-        # US major timezones
-        us_timezones = [
-            'America/Los_Angeles',  # Pacific Time
-            'America/Denver',       # Mountain Time
-            'America/Chicago',      # Central Time
-            'America/New_York',     # Eastern Time
-            'America/Anchorage',    # Alaska Time
-            'Pacific/Honolulu',     # Hawaii Time
-        ]
-        
-        # Get all Africa timezones from pytz
-        africa_timezones = [tz for tz in pytz.all_timezones if tz.startswith('Africa/')]
+        """Get US and all Africa timezones, cached on disk until an offset changes"""
+        cache_key = (TZ_BACKEND, tz_data_version())
+        now_utc = datetime.datetime.now(datetime.timezone.utc)
+        try:
+            with open(TZ_CACHE_FILE, 'rb') as f:
+                key, expires, tz_list = pickle.load(f)
+            if key == cache_key and now_utc < expires:
+                return tz_list
+        except Exception:
+            pass
+
+        tz_list = self._build_timezones()
+
+        # Don't persist a list built from missing or partial tz data
+        tz_names = {tz_name for _, tz_name in tz_list}
+        if not tz_names.issuperset(US_TIMEZONES + ['UTC']):
+            return tz_list
+
+        # The offset labels go stale at the next DST transition of any zone
+        expires = next_offset_change([get_zone(name) for name in tz_names], now_utc)
+        try:
+            os.makedirs(os.path.dirname(TZ_CACHE_FILE), exist_ok=True)
+            with open(TZ_CACHE_FILE, 'wb') as f:
+                pickle.dump((cache_key, expires, tz_list), f)
+        except OSError:
+            pass
+        return tz_list
+
+    def _build_timezones(self):
+        # Get all Africa timezones from the tz database
+        africa_timezones = sorted(tz for tz in available_timezones() if tz.startswith('Africa/'))
         
         # Combine US and Africa timezones, plus UTC
-        selected_timezones = us_timezones + africa_timezones + ['UTC']
+        selected_timezones = US_TIMEZONES + africa_timezones + ['UTC']
         
         tz_list = []
-        now_utc = datetime.datetime.now(pytz.utc)
+        now_utc = datetime.datetime.now(datetime.timezone.utc)
         
         for tz_name in selected_timezones:
             try:
-                tz = pytz.timezone(tz_name)
+                tz = ZoneInfo(tz_name)
                 dt = now_utc.astimezone(tz)
                 offset = dt.utcoffset() or datetime.timedelta(0)
                 total_minutes = offset.total_seconds() / 60
@@ -124,7 +309,7 @@ class MeetingScheduler(tk.Tk):
                 hours, minutes = divmod(abs(int(total_minutes)), 60)
                 
                 # Add clearer labels for US timezones
-                if tz_name in us_timezones:
+                if tz_name in US_TIMEZONES:
                     if 'Los_Angeles' in tz_name:
                         label = 'US Pacific Time'
                     elif 'Denver' in tz_name:
@@ -161,7 +346,7 @@ class MeetingScheduler(tk.Tk):
         self.local_tz_cb.grid(row=0, column=1, padx=5, pady=5)
 
         # Set default to Los Angeles
-        la_display = next((disp for disp, tz in self.timezone_list if "Pacific Time" in disp), "(UTC-07:00) US Pacific Time")
+        la_display = self.tz_display_map.get('America/Los_Angeles', "(UTC-07:00) US Pacific Time")
         self.local_tz_cb.set(la_display)
 
         tk.Label(top_frame, text="Other Time Zone:", bg='black', fg='white').grid(row=0, column=2, padx=5, pady=5, sticky='w')
@@ -221,7 +406,7 @@ class MeetingScheduler(tk.Tk):
             self.day_headers.append(lbl)
 
         # Scrollable canvas
-        self.canvas = tk.Canvas(calendar_container, bg='black')
+        self.canvas = tk.Canvas(calendar_container, bg='black', highlightthickness=0)
         self.canvas.grid(row=1, column=0, sticky='nsew')
 
         # When the mouse enters the canvas, give it focus so it receives wheel events.
@@ -237,69 +422,66 @@ class MeetingScheduler(tk.Tk):
         v_scroll.grid(row=1, column=1, sticky='ns')
         self.canvas.configure(yscrollcommand=v_scroll.set)
 
-        # Grid frame
-        self.grid_frame = tk.Frame(self.canvas, bg='black')
-        self.canvas.create_window((0, 0), window=self.grid_frame, anchor="nw")
-
-        # Configure grid frame columns to match header weights
-        self.grid_frame.grid_columnconfigure(0, weight=1)  # Local Time
-        self.grid_frame.grid_columnconfigure(1, weight=1)  # Other Time
-        for i in range(2, 9):
-            self.grid_frame.grid_columnconfigure(i, weight=2)  # Day columns get more weight
-
         # Bind events
         self.bind('<Configure>', self._on_configure)
 
-        # After creating the grid_frame
-        self.grid_frame = tk.Frame(self.canvas, bg='black')
-        self.canvas.create_window((0, 0), window=self.grid_frame, anchor="nw")
-
-        # Update scroll region when grid_frame changes
-        self.grid_frame.bind("<Configure>", lambda event: self.canvas.configure(scrollregion=self.canvas.bbox("all")))
-
-        # Create time slots (48 half-hour slots for 24 hours)
+        # Time slots (48 half-hour slots for 24 hours) are created in _phase3_grid
         self.total_slots = 48
-        self.create_time_grid()
+
+        # Naive slot start times, plus the end boundary of the last slot
+        midnight = datetime.datetime.combine(datetime.date.today(), datetime.time())
+        self._slot_dts = tuple(midnight + datetime.timedelta(minutes=slot * 30)
+                               for slot in range(self.total_slots + 1))
 
     def create_time_grid(self):
-        label_config = {
-            'borderwidth': 1,
-            'relief': "solid",
-            'bg': 'white',
-            'fg': 'black',
-            'width': 7
-        }
-        cell_config = {
-            'borderwidth': 1,
-            'relief': "solid",
-            'bg': 'white',
-            'width': 14
-        }
-        
-        for slot in range(self.total_slots):
+        # Cells are drawn as canvas items rather than one Label widget each;
+        # real coordinates are assigned in _layout_grid
+        self.grid_items = {}  # (column, slot) -> (rect id, text id or None)
+        self.cell_items = {}  # (day, slot) -> rect id
+        self.item_cells = {}  # rect id -> (day, slot)
+        self.cell_bg = {}
+        self.cell_states = [[False] * self.total_slots for _ in range(7)]  # [day][slot]
+
+    def create_grid_rows(self, start_slot, end_slot):
+        for slot in range(start_slot, end_slot):
             # Time labels
-            lbl_local = tk.Label(self.grid_frame, bg='white', fg='black', 
-                                borderwidth=1, relief="solid", width=self.time_label_width)
-            lbl_local.grid(row=slot, column=0, sticky="ew", padx=1, pady=1)
-            self.local_time_labels[slot] = lbl_local
-            
-            lbl_other = tk.Label(self.grid_frame, bg='white', fg='black',
-                                borderwidth=1, relief="solid", width=self.time_label_width)
-            lbl_other.grid(row=slot, column=1, sticky="ew", padx=1, pady=1)
-            self.other_time_labels[slot] = lbl_other
+            for col, labels in ((0, self.local_time_labels), (1, self.other_time_labels)):
+                rect = self.canvas.create_rectangle(0, 0, 0, 0, fill='white', outline='black')
+                text = self.canvas.create_text(0, 0, text='', fill='black')
+                self.grid_items[(col, slot)] = (rect, text)
+                labels[slot] = text
 
             # Day cells
             for day in range(7):
-                cell = tk.Label(self.grid_frame, bg='white', fg='black',
-                            borderwidth=1, relief="solid", width=self.day_header_width)
-                cell.grid(row=slot, column=day+2, sticky="ew", padx=1, pady=1)
-                cell.day = day
-                cell.slot = slot
-                cell.bind("<Button-1>", self.on_cell_click)
-                cell.bind("<Button-3>", self.on_cell_right_click)
-                
-                self.slot_labels[(day, slot)] = cell
-                self.cell_states[(day, slot)] = False
+                rect = self.canvas.create_rectangle(0, 0, 0, 0, fill='white', outline='black',
+                                                    tags=('cell', f'c{day}_{slot}'))
+                self.grid_items[(day + 2, slot)] = (rect, None)
+                self.cell_items[(day, slot)] = rect
+                self.item_cells[rect] = (day, slot)
+                self.cell_bg[(day, slot)] = 'white'
+
+    def _layout_grid(self, event=None):
+        # Line the canvas columns up with the header labels (padx=1, pady=1)
+        for col in range(9):
+            x, _, width, _ = self.header_frame.grid_bbox(col, 0)
+            x0, x1 = x + 1, x + width - 1
+            for slot in range(self.total_slots):
+                y0 = slot * self.row_height + 1
+                y1 = y0 + self.row_height - 2
+                rect, text = self.grid_items[(col, slot)]
+                self.canvas.coords(rect, x0, y0, x1, y1)
+                if text is not None:
+                    self.canvas.coords(text, (x0 + x1) / 2, (y0 + y1) / 2)
+
+        self.canvas.configure(scrollregion=(0, 0, self.header_frame.winfo_width(),
+                                            self.total_slots * self.row_height))
+
+    def _cell_at(self, x, y):
+        # Map canvas widget coordinates to the (day, slot) of the cell under them
+        if not (0 <= x < self.canvas.winfo_width() and 0 <= y < self.canvas.winfo_height()):
+            return None
+        items = self.canvas.find_closest(self.canvas.canvasx(x), self.canvas.canvasy(y))
+        return self.item_cells.get(items[0]) if items else None
 
     def create_bottom_section(self):
         bottom_frame = tk.Frame(self.main_container, bg='black')
@@ -318,14 +500,8 @@ class MeetingScheduler(tk.Tk):
     def _on_configure(self, event):
         # Only handle main window resizing
         if event.widget == self:
-            # Update canvas scroll region
-            self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-            
-            # Update grid frame width to match canvas
+            # Force header frame to match canvas width
             canvas_width = self.canvas.winfo_width()
-            self.grid_frame.configure(width=canvas_width)
-            
-            # Force header frame to match grid frame width
             self.header_frame.configure(width=canvas_width)
 
     def _on_mousewheel(self, event):
@@ -342,96 +518,66 @@ class MeetingScheduler(tk.Tk):
         start_week = today - datetime.timedelta(days=today.weekday())
         return [start_week + datetime.timedelta(days=i) for i in range(7)]
 
-    def get_slot_datetime(self, slot):
-        minutes = slot * 30  # 30-minute increments
-        return datetime.datetime.combine(datetime.date.today(), 
-                                       datetime.time(hour=minutes // 60, 
-                                                   minute=minutes % 60))
-
     def timezone_changed(self, event):
+        if not self.ready:
+            return
+        self._recompute_tz_tables()
         self.update_time_labels()
         self.update_meeting_proposal()
 
+    def _recompute_tz_tables(self):
+        # Slot times only depend on the selected timezones, so convert
+        # each slot once here instead of on every redraw
+        local_tz_name = self._disp_to_tzname.get(self.local_tz_cb.get(), "Etc/UTC")
+        target_tz_name = self._disp_to_tzname.get(self.target_tz_cb.get(), "Etc/UTC")
+        self._local_strs, self._target_strs, self._business = slot_tables(self._slot_dts, local_tz_name, target_tz_name)
+
     def update_time_labels(self):
         print("Starting time label update...")
-        local_disp = self.local_tz_cb.get()
-        target_disp = self.target_tz_cb.get()
-        print(f"Got timezone displays: {local_disp}, {target_disp}")
-        
-        local_tz_name = next((tz for disp, tz in self.timezone_list if disp == local_disp), "Etc/UTC")
-        target_tz_name = next((tz for disp, tz in self.timezone_list if disp == target_disp), "Etc/UTC")
-        print(f"Found timezone names: {local_tz_name}, {target_tz_name}")
-        
-        local_tz = pytz.timezone(local_tz_name)
-        target_tz = pytz.timezone(target_tz_name)
-        
-        print(f"Starting slot updates...")
         for slot in range(self.total_slots):
-            dt = self.get_slot_datetime(slot)
-            try:
-                dt_local = local_tz.localize(dt)
-                dt_target = dt_local.astimezone(target_tz)
-                
-                self.local_time_labels[slot].config(text=dt_local.strftime("%H:%M"))
-                self.other_time_labels[slot].config(text=dt_target.strftime("%H:%M"))
-                
-                # Update cell colors for this slot
-                for day in range(7):
-                    cell = self.slot_labels[(day, slot)]
-                    is_selected = self.cell_states.get((day, slot), False)
-                    is_business = self.is_business_hours(slot)
-                    
-                    if is_selected:
-                        cell.config(bg="#FFDAB9")
-                    else:
-                        cell.config(bg="white" if is_business else "#C7C7C7")
-                        
-            except Exception as e:
-                print(f"Error in slot {slot}: {e}")
-                continue
+            self.canvas.itemconfig(self.local_time_labels[slot], text=self._local_strs[slot])
+            self.canvas.itemconfig(self.other_time_labels[slot], text=self._target_strs[slot])
+            
+            # Update cell colors for this slot
+            for day in range(7):
+                self.update_cell_appearance(day, slot)
+
+    def update_cell_appearance(self, day, slot):
+        if self.cell_states[day][slot]:
+            bg = "#FFDAB9"
+        else:
+            bg = "white" if self.is_business_hours(slot) else "#C7C7C7"
+
+        # Skip the Tcl round-trip when the color is already applied
+        if self.cell_bg[(day, slot)] != bg:
+            self.canvas.itemconfig(self.cell_items[(day, slot)], fill=bg)
+            self.cell_bg[(day, slot)] = bg
 
     def is_business_hours(self, slot):
-        # Get the base time for this slot
-        time = self.get_slot_datetime(slot)
-        
-        # Get target timezone
-        target_disp = self.target_tz_cb.get()
-        target_tz_name = next((tz for disp, tz in self.timezone_list if disp == target_disp), "Etc/UTC")
-        target_tz = pytz.timezone(target_tz_name)
-        
-        # Get local timezone for conversion
-        local_disp = self.local_tz_cb.get()
-        local_tz_name = next((tz for disp, tz in self.timezone_list if disp == local_disp), "Etc/UTC")
-        local_tz = pytz.timezone(local_tz_name)
-        
-        # First localize base time to local timezone, then convert to target timezone
-        local_dt = local_tz.localize(time)
-        target_dt = local_dt.astimezone(target_tz)
-        
         # Check if the target timezone time is within business hours
-        return 8 <= target_dt.hour < 18
+        return self._business[slot]
 
     def on_cell_click(self, event):
-        cell = event.widget
-        day, slot = cell.day, cell.slot
+        cell = self._cell_at(event.x, event.y)
+        if cell is None:
+            return
+        day, slot = cell
         
-        self.selection_mode = not self.cell_states[(day, slot)]
+        self.selection_mode = not self.cell_states[day][slot]
         self.start_cell = (day, slot)
         self.last_cell = (day, slot)
         self.dragging = True
         
         self.set_cell_state(day, slot, self.selection_mode)
-        self.update_meeting_proposal()
+        self._schedule_proposal()
 
     def on_drag(self, event):
         if not self.dragging or not self.start_cell:
             return
             
-        widget = self.winfo_containing(event.x_root, event.y_root)
+        current_cell = self._cell_at(event.x, event.y)
         
-        if hasattr(widget, 'day') and hasattr(widget, 'slot'):
-            current_cell = (widget.day, widget.slot)
-            
+        if current_cell is not None:
             if current_cell != self.last_cell:
                 self.update_selection(self.start_cell, current_cell)
                 self.last_cell = current_cell
@@ -441,7 +587,7 @@ class MeetingScheduler(tk.Tk):
             self.dragging = False
             self.start_cell = None
             self.last_cell = None
-            self.update_meeting_proposal()
+            self._do_update_proposal()
 
     def update_selection(self, start, end):
         start_day, start_slot = start
@@ -463,56 +609,51 @@ class MeetingScheduler(tk.Tk):
             self.set_cell_state(day, slot, self.selection_mode)
 
     def set_cell_state(self, day, slot, state):
-        self.cell_states[(day, slot)] = state
+        self.cell_states[day][slot] = state
         self.update_cell_appearance(day, slot)
 
     def on_cell_right_click(self, event):
-        cell = event.widget
-        self.set_cell_state(cell.day, cell.slot, False)
+        cell = self._cell_at(event.x, event.y)
+        if cell is None:
+            return
+        self.set_cell_state(*cell, False)
+        self._schedule_proposal()
+
+    def _schedule_proposal(self):
+        # Coalesce bursts of selection changes into a single proposal rebuild
+        if self._pending_proposal:
+            self.after_cancel(self._pending_proposal)
+        self._pending_proposal = self.after(50, self._do_update_proposal)
+
+    def _do_update_proposal(self):
+        if self._pending_proposal:
+            self.after_cancel(self._pending_proposal)
+            self._pending_proposal = None
         self.update_meeting_proposal()
 
     def update_meeting_proposal(self):
+        if not self.ready:
+            return
         duration = self.duration_cb.get()
         target_disp = self.target_tz_cb.get()
         
-        # Get the target timezone
-        target_tz_name = next((tz for disp, tz in self.timezone_list if disp == target_disp), "Etc/UTC")
-        target_tz = pytz.timezone(target_tz_name)
-        
         lines = [f"Would {duration} during any of the following times (all {target_disp}) work for you?"]
         
         for day in range(7):
-            selected_slots = sorted([slot for slot in range(self.total_slots) 
-                                if self.cell_states.get((day, slot), False)])
+            # Collect runs of consecutive selected slots as (first, last)
+            groups = []
+            slot = 0
+            for selected, run in groupby(self.cell_states[day]):
+                length = len(list(run))
+                if selected:
+                    groups.append((slot, slot + length - 1))
+                slot += length
             
-            if selected_slots:
-                groups = []
-                start_slot = selected_slots[0]
-                prev_slot = selected_slots[0]
-                
-                for s in selected_slots[1:]:
-                    if s == prev_slot + 1:
-                        prev_slot = s
-                    else:
-                        groups.append((start_slot, prev_slot))
-                        start_slot = s
-                        prev_slot = s
-                groups.append((start_slot, prev_slot))
-                
+            if groups:
                 range_strs = []
                 for start_s, end_s in groups:
-                    # Convert slots to target timezone
-                    start_time = self.get_slot_datetime(start_s)
-                    end_time = self.get_slot_datetime(end_s + 1)
-                    
-                    local_tz_name = next((tz for disp, tz in self.timezone_list 
-                                        if disp == self.local_tz_cb.get()), "Etc/UTC")
-                    local_tz = pytz.timezone(local_tz_name)
-                    
-                    start_target = local_tz.localize(start_time).astimezone(target_tz)
-                    end_target = local_tz.localize(end_time).astimezone(target_tz)
-                    
-                    range_strs.append(f"{start_target.strftime('%H:%M')} - {end_target.strftime('%H:%M')}")
+                    # Slot times are already converted to the target timezone
+                    range_strs.append(f"{self._target_strs[start_s]} - {self._target_strs[end_s + 1]}")
                 
                 day_str = self.week_dates[day].strftime("%A, %b %d")
                 lines.append(f"* {day_str}: " + ", ".join(range_strs))